@@ -4,8 +4,9 @@ import os
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from flightledger.runtime import FlightLedgerRuntime
@@ -61,8 +62,8 @@ def health() -> dict[str, str]:
 
 
 @app.get("/api/dashboard")
-def dashboard(refresh: bool = False) -> dict[str, Any]:
-    return runtime.dashboard_payload(refresh=refresh)
+def dashboard(refresh: bool = False) -> Response:
+    return Response(content=runtime.dashboard_payload_json(refresh=refresh), media_type="application/json")
 
 
 @app.get("/api/tickets/{ticket_number}")
@@ -71,8 +72,8 @@ def get_ticket(ticket_number: str) -> dict[str, Any]:
 
 
 @app.get("/api/tickets/{ticket_number}/history")
-def get_ticket_history(ticket_number: str) -> list[dict[str, Any]]:
-    return runtime.ticket_history(ticket_number)
+def get_ticket_history(ticket_number: str) -> StreamingResponse:
+    return StreamingResponse(runtime.ticket_history_stream(ticket_number), media_type="application/json")
 
 
 @app.get("/api/matching/summary")
@@ -128,8 +129,8 @@ def get_dag_run(run_id: str) -> dict[str, Any]:
 
 
 @app.get("/api/settlements")
-def get_settlements(status: str | None = None) -> list[dict[str, Any]]:
-    return runtime.settlements(status=status)
+def get_settlements(status: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+    return runtime.settlements(status=status, limit=limit)
 
 
 @app.get("/api/settlements/{settlement_id}/saga")
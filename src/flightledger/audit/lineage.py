@@ -52,6 +52,30 @@ class AuditStore:
         stored = self.repository.insert(row)
         return AuditRecord(**stored)
 
+    def bulk_log(self, entries: list[dict[str, Any]]) -> list[AuditRecord]:
+        """Insert several audit rows with one timestamp and one insert pass.
+
+        Each entry takes the same keys as ``log``; insertion order is
+        preserved since all rows share a timestamp and the sort is stable.
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
+        rows = [
+            {
+                "id": str(uuid4()),
+                "timestamp": timestamp,
+                "action": entry["action"],
+                "component": entry["component"],
+                "ticket_number": entry.get("ticket_number"),
+                "input_event_ids": entry.get("input_event_ids") or [],
+                "output_reference": entry.get("output_reference"),
+                "detail": entry.get("detail") or {},
+                "raw_source_hash": entry.get("raw_source_hash"),
+            }
+            for entry in entries
+        ]
+        stored = self.repository.insert_many(rows)
+        return [AuditRecord(**row) for row in stored]
+
     def get_lineage(self, output_reference: str) -> list[AuditRecord]:
         rows = self.repository.get_by_output_reference(output_reference)
         return [AuditRecord(**row) for row in rows]
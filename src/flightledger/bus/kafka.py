@@ -28,8 +28,7 @@ class KafkaBus:
 
     def publish(self, event: CanonicalEvent) -> None:
         topic = EVENT_TOPIC_MAP[event.event_type]
-        payload = event.model_dump(mode="json")
-        self._producer.send(topic, key=event.ticket_number, value=payload)
+        self._producer.send(topic, key=event.ticket_number, value=event.dump_payload())
 
     def publish_many(self, events: Iterable[CanonicalEvent]) -> None:
         for event in events:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -26,9 +27,25 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _intern_statuses(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Intern status strings coming off the wire.
+
+    Status values from Supabase are fresh allocations, so every
+    ``row["status"] == "matched"`` falls back to character comparison.
+    Interned strings match the (already interned) code literals by identity.
+    """
+    for row in rows:
+        status = row.get("status")
+        if type(status) is str:
+            row["status"] = sys.intern(status)
+    return rows
+
+
 @dataclass
 class _MemoryState:
     ticket_events: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    # Write-time index so get_by_event_types is a lookup instead of a full scan.
+    ticket_events_by_type: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
     ticket_current_state: dict[str, dict[str, Any]] = field(default_factory=dict)
     coupon_matches: dict[tuple[str, int], dict[str, Any]] = field(default_factory=dict)
     recon_results: dict[str, dict[str, Any]] = field(default_factory=dict)
@@ -40,6 +57,7 @@ class _MemoryState:
 
     def reset(self) -> None:
         self.ticket_events.clear()
+        self.ticket_events_by_type.clear()
         self.ticket_current_state.clear()
         self.coupon_matches.clear()
         self.recon_results.clear()
@@ -60,9 +78,17 @@ class _BaseRepository:
 
 
 class TicketEventRepository(_BaseRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        # Per-ticket high-water sequence so Supabase appends skip the
+        # order-by/limit query per event; memory reads are already O(1).
+        self._seq: dict[str, int] = {}
+
     def reset(self) -> None:
+        self._seq.clear()
         if self.backend == StorageBackend.MEMORY:
             _MEMORY_STATE.ticket_events.clear()
+            _MEMORY_STATE.ticket_events_by_type.clear()
             return
         self.client.table("ticket_events").delete().neq("ticket_number", "").execute()
 
@@ -70,6 +96,9 @@ class TicketEventRepository(_BaseRepository):
         if self.backend == StorageBackend.MEMORY:
             history = _MEMORY_STATE.ticket_events.get(ticket_number, [])
             return len(history) + 1
+        cached = self._seq.get(ticket_number)
+        if cached is not None:
+            return cached + 1
         response = (
             self.client.table("ticket_events")
             .select("event_sequence")
@@ -79,9 +108,9 @@ class TicketEventRepository(_BaseRepository):
             .execute()
         )
         rows = response.data or []
-        if not rows:
-            return 1
-        return int(rows[0]["event_sequence"]) + 1
+        current = int(rows[0]["event_sequence"]) if rows else 0
+        self._seq[ticket_number] = current
+        return current + 1
 
     def find_by_event_id(self, event_id: str) -> dict[str, Any] | None:
         if self.backend == StorageBackend.MEMORY:
@@ -108,10 +137,27 @@ class TicketEventRepository(_BaseRepository):
                 raise ValueError("Duplicate ticket_number + event_sequence")
             history.append(row)
             history.sort(key=lambda item: item["event_sequence"])
+            _MEMORY_STATE.ticket_events_by_type.setdefault(row["event_type"], []).append(row)
             return row
         response = self.client.table("ticket_events").insert(row).execute()
+        self._record_sequence(row)
         return (response.data or [row])[0]
 
+    def insert_many(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.backend == StorageBackend.MEMORY:
+            for row in rows:
+                self.insert(row)
+            return rows
+        response = self.client.table("ticket_events").insert(rows).execute()
+        for row in rows:
+            self._record_sequence(row)
+        return response.data or rows
+
+    def _record_sequence(self, row: dict[str, Any]) -> None:
+        sequence = int(row["event_sequence"])
+        if sequence > self._seq.get(row["ticket_number"], 0):
+            self._seq[row["ticket_number"]] = sequence
+
     def get_by_ticket(self, ticket_number: str) -> list[dict[str, Any]]:
         if self.backend == StorageBackend.MEMORY:
             return list(_MEMORY_STATE.ticket_events.get(ticket_number, []))
@@ -145,8 +191,8 @@ class TicketEventRepository(_BaseRepository):
     def get_by_event_types(self, event_types: list[str]) -> list[dict[str, Any]]:
         if self.backend == StorageBackend.MEMORY:
             rows: list[dict[str, Any]] = []
-            for ticket_rows in _MEMORY_STATE.ticket_events.values():
-                rows.extend([row for row in ticket_rows if row["event_type"] in event_types])
+            for event_type in event_types:
+                rows.extend(_MEMORY_STATE.ticket_events_by_type.get(event_type, ()))
             return rows
         response = self.client.table("ticket_events").select("*").in_("event_type", event_types).execute()
         return response.data or []
@@ -160,11 +206,34 @@ class TicketEventRepository(_BaseRepository):
         response = self.client.table("ticket_events").select("*").execute()
         return response.data or []
 
+    def count(self) -> int:
+        if self.backend == StorageBackend.MEMORY:
+            return sum(len(rows) for rows in _MEMORY_STATE.ticket_events.values())
+        response = self.client.table("ticket_events").select("id", count="exact").execute()
+        return int(response.count or 0)
+
+    def get_rows_by_ticket_prefix(self, prefix: str) -> list[dict[str, Any]]:
+        if self.backend == StorageBackend.MEMORY:
+            # Events are keyed by ticket, so the prefix test runs once per
+            # ticket instead of once per row.
+            rows: list[dict[str, Any]] = []
+            for ticket_number, ticket_rows in _MEMORY_STATE.ticket_events.items():
+                if ticket_number.startswith(prefix):
+                    rows.extend(ticket_rows)
+            return rows
+        response = self.client.table("ticket_events").select("*").like("ticket_number", f"{prefix}%").execute()
+        return response.data or []
+
     def delete_by_ticket_prefix(self, prefix: str) -> None:
+        for ticket_number in list(self._seq):
+            if ticket_number.startswith(prefix):
+                del self._seq[ticket_number]
         if self.backend == StorageBackend.MEMORY:
             for ticket_number in list(_MEMORY_STATE.ticket_events.keys()):
                 if ticket_number.startswith(prefix):
                     del _MEMORY_STATE.ticket_events[ticket_number]
+            for typed_rows in _MEMORY_STATE.ticket_events_by_type.values():
+                typed_rows[:] = [row for row in typed_rows if not row["ticket_number"].startswith(prefix)]
             return
         self.client.table("ticket_events").delete().like("ticket_number", f"{prefix}%").execute()
 
@@ -201,6 +270,22 @@ class TicketCurrentStateRepository(_BaseRepository):
         response = self.client.table("ticket_current_state").select("*").execute()
         return response.data or []
 
+    def count(self) -> int:
+        if self.backend == StorageBackend.MEMORY:
+            return len(_MEMORY_STATE.ticket_current_state)
+        response = self.client.table("ticket_current_state").select("ticket_number", count="exact").execute()
+        return int(response.count or 0)
+
+    def get_rows_by_ticket_prefix(self, prefix: str) -> list[dict[str, Any]]:
+        if self.backend == StorageBackend.MEMORY:
+            return [
+                row
+                for ticket_number, row in _MEMORY_STATE.ticket_current_state.items()
+                if ticket_number.startswith(prefix)
+            ]
+        response = self.client.table("ticket_current_state").select("*").like("ticket_number", f"{prefix}%").execute()
+        return response.data or []
+
     def delete_by_ticket_prefix(self, prefix: str) -> None:
         if self.backend == StorageBackend.MEMORY:
             for ticket_number in list(_MEMORY_STATE.ticket_current_state.keys()):
@@ -231,7 +316,7 @@ class CouponMatchRepository(_BaseRepository):
         if self.backend == StorageBackend.MEMORY:
             return list(_MEMORY_STATE.coupon_matches.values())
         response = self.client.table("coupon_matches").select("*").execute()
-        return response.data or []
+        return _intern_statuses(response.data or [])
 
     def get_suspense(self, min_age: int) -> list[dict[str, Any]]:
         rows = self.all_rows()
@@ -263,7 +348,7 @@ class ReconRepository(_BaseRepository):
         if self.backend == StorageBackend.MEMORY:
             return list(_MEMORY_STATE.recon_results.values())
         response = self.client.table("recon_results").select("*").execute()
-        return response.data or []
+        return _intern_statuses(response.data or [])
 
     def get_breaks(self, status: str = "unresolved", break_type: str | None = None) -> list[dict[str, Any]]:
         rows = [row for row in self.all_rows() if row["status"] == "break"]
@@ -304,6 +389,15 @@ class AuditRepository(_BaseRepository):
         response = self.client.table("audit_log").insert(row).execute()
         return (response.data or [row])[0]
 
+    def insert_many(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.backend == StorageBackend.MEMORY:
+            inserted = [row if "id" in row else {**row, "id": str(uuid4())} for row in rows]
+            _MEMORY_STATE.audit_log.extend(inserted)
+            _MEMORY_STATE.audit_log.sort(key=lambda item: item["timestamp"])
+            return inserted
+        response = self.client.table("audit_log").insert(rows).execute()
+        return response.data or rows
+
     def get_by_ticket(self, ticket_number: str) -> list[dict[str, Any]]:
         if self.backend == StorageBackend.MEMORY:
             return [row for row in _MEMORY_STATE.audit_log if row.get("ticket_number") == ticket_number]
@@ -334,6 +428,28 @@ class AuditRepository(_BaseRepository):
         response = self.client.table("audit_log").select("*").execute()
         return response.data or []
 
+    def count(self) -> int:
+        if self.backend == StorageBackend.MEMORY:
+            return len(_MEMORY_STATE.audit_log)
+        response = self.client.table("audit_log").select("id", count="exact").execute()
+        return int(response.count or 0)
+
+    def get_by_prefix_or_component(self, ticket_prefix: str, component: str) -> list[dict[str, Any]]:
+        if self.backend == StorageBackend.MEMORY:
+            return [
+                row
+                for row in _MEMORY_STATE.audit_log
+                if row.get("component") == component
+                or str(row.get("ticket_number") or "").startswith(ticket_prefix)
+            ]
+        response = (
+            self.client.table("audit_log")
+            .select("*")
+            .or_(f"ticket_number.like.{ticket_prefix}%,component.eq.{component}")
+            .execute()
+        )
+        return response.data or []
+
 
 class DagRunRepository(_BaseRepository):
     def insert(self, row: dict[str, Any]) -> dict[str, Any]:
@@ -358,6 +474,19 @@ class DagRunRepository(_BaseRepository):
         rows = response.data or []
         return rows[0] if rows else None
 
+    def get_run(self, run_id: str) -> dict[str, Any] | None:
+        """Read-model join of a dag_run row with its task_run rows."""
+        run = self.get(run_id)
+        if not run:
+            return None
+        if self.backend == StorageBackend.MEMORY:
+            tasks = [row for row in _MEMORY_STATE.task_runs.values() if row["dag_run_id"] == run_id]
+        else:
+            response = self.client.table("task_runs").select("*").eq("dag_run_id", run_id).execute()
+            tasks = response.data or []
+        tasks.sort(key=lambda row: row["task_name"])
+        return {"run": run, "tasks": tasks}
+
 
 class TaskRunRepository(_BaseRepository):
     def insert(self, row: dict[str, Any]) -> dict[str, Any]:
@@ -420,7 +549,7 @@ class SettlementRepository(_BaseRepository):
         if self.backend == StorageBackend.MEMORY:
             return list(_MEMORY_STATE.settlements.values())
         response = self.client.table("settlements").select("*").execute()
-        return response.data or []
+        return _intern_statuses(response.data or [])
 
     def insert_saga(self, row: dict[str, Any]) -> dict[str, Any]:
         if self.backend == StorageBackend.MEMORY:
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+from threading import Lock
+from uuid import UUID
+
+
+class _UUIDPool:
+    """Amortize the per-uuid4 os.urandom syscall across a batch of ids.
+
+    Hot paths allocate ids per row or per logged operation; fetching 16
+    bytes per call syscalls into the kernel CSPRNG, so we pre-fetch a block
+    and slice it, patching the version/variant bits to keep RFC 4122 v4
+    format. The shared pool is drawn from under FastAPI's threadpool, so
+    draws are serialised with a lock — unsynchronised offset bumps would
+    hand the same slice to two threads and duplicate primary keys.
+    """
+
+    def __init__(self, batch: int = 256) -> None:
+        self._batch = batch
+        self._buf = b""
+        self._offset = 0
+        self._lock = Lock()
+
+    def next(self) -> str:
+        with self._lock:
+            if self._offset >= len(self._buf):
+                self._buf = os.urandom(16 * self._batch)
+                self._offset = 0
+            raw = bytearray(self._buf[self._offset : self._offset + 16])
+            self._offset += 16
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        return str(UUID(bytes=bytes(raw)))
+
+
+_pool = _UUIDPool()
+
+
+def pooled_uuid4() -> str:
+    """Return a random RFC 4122 v4 uuid string from the shared pool."""
+    return _pool.next()
@@ -6,7 +6,7 @@ from enum import Enum
 from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class SourceSystem(str, Enum):
@@ -48,3 +48,25 @@ class CanonicalEvent(BaseModel):
     net_amount: Decimal | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    _payload_cache: dict[str, Any] | None = PrivateAttr(default=None)
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> CanonicalEvent:
+        # Private attrs are carried over by pydantic's copy, so drop the
+        # serialized-payload cache: the copy usually diverges via update.
+        copied = super().model_copy(update=update, deep=deep)
+        copied._payload_cache = None
+        return copied
+
+    def dump_payload(self) -> dict[str, Any]:
+        """JSON-mode dump, computed once per instance.
+
+        Events only change via copy-with-update, which starts the copy with
+        a cold cache, so the serialized form can be cached instead of
+        re-walking every field per append.
+        """
+        if self._payload_cache is None:
+            self._payload_cache = self.model_dump(mode="json")
+        return self._payload_cache
+
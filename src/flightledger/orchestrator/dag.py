@@ -183,10 +183,5 @@ class DAGRunner:
         )
 
     def get_run(self, run_id: str) -> dict[str, Any] | None:
-        run = self.dag_repo.get(run_id)
-        if not run:
-            return None
-        tasks = self.task_repo.get_by_run(run_id)
-        tasks.sort(key=lambda row: row["task_name"])
-        return {"run": run, "tasks": tasks}
+        return self.dag_repo.get_run(run_id)
 
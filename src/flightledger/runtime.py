@@ -6,15 +6,19 @@ from collections import Counter
 from dataclasses import asdict
 from datetime import datetime, timezone
 from decimal import Decimal
+from operator import itemgetter
 from pathlib import Path
-from threading import Lock
-from typing import Any
+from threading import Event, Lock
+from typing import Any, Iterator
+
+import orjson
+from pydantic import TypeAdapter
 
 from flightledger.audit.lineage import AuditStore
 from flightledger.db.repositories import DagRunRepository, TaskRunRepository, get_storage_backend, reset_memory_backend
 from flightledger.bus.in_memory import InMemoryBus
 from flightledger.matching.coupon_matcher import CouponMatcher
-from flightledger.models.canonical import CanonicalEventType
+from flightledger.models.canonical import CanonicalEvent, CanonicalEventType
 from flightledger.orchestrator.dag import DAG, DAGRunner, Task
 from flightledger.pipeline import SOURCE_CHANNELS, SourceChannel, ingest_demo
 from flightledger.recon.reconciliation import ReconciliationEngine, ReconSummary
@@ -27,6 +31,17 @@ def _decimal_to_float(value: Decimal | None) -> float | None:
     return float(value) if value is not None else None
 
 
+# Dispatches to pydantic-core's Rust serializer, skipping the
+# BaseModel -> dict -> JSON round-trip taken by model_dump(mode="json").
+_EVENT_LIST_ADAPTER = TypeAdapter(list[CanonicalEvent])
+
+_STATUS = itemgetter("status")
+
+_D_ZERO = Decimal("0")
+_D_ONE = Decimal("1")
+_D_FIVE = Decimal("5")
+
+
 class FlightLedgerRuntime:
     def __init__(self, data_dir: Path) -> None:
         self.data_dir = data_dir
@@ -40,15 +55,35 @@ class FlightLedgerRuntime:
         self.task_run_repo = TaskRunRepository()
         self._last_bus = None
         self._last_channels: list[dict[str, Any]] = []
+        self._topic_json_cache: dict[str, bytes] = {}
         self._last_recon_summary = ReconSummary(total_matched=0, total_breaks=0, breaks_by_type={}, breaks_by_severity={})
         self._seeded = False
+        self._seeding = False
         self._seed_lock = Lock()
+        self._seed_done = Event()
         self._dags = self._build_dags()
 
     def refresh(self, force: bool = True) -> None:
-        with self._seed_lock:
-            if self._seeded and not force:
-                return
+        # Claim the seed under the lock, then do the multi-second ingest/match/
+        # bootstrap work outside it so concurrent callers block on the Event
+        # instead of serialising behind the critical section.
+        while True:
+            with self._seed_lock:
+                if self._seeded and not force:
+                    return
+                if not self._seeding:
+                    self._seeding = True
+                    self._seed_done.clear()
+                    break
+            self._seed_done.wait()
+            # The Event also fires when the claiming thread's seed work
+            # raised; only trust it if seeding actually landed, otherwise
+            # loop back and re-attempt the claim ourselves.
+            with self._seed_lock:
+                if self._seeded:
+                    return
+
+        try:
             if get_storage_backend().value == "memory":
                 reset_memory_backend()
                 self.dag_run_repo = DagRunRepository()
@@ -66,6 +101,10 @@ class FlightLedgerRuntime:
             self._run_matching_recon()
             self._bootstrap_settlements()
             self._seeded = True
+        finally:
+            with self._seed_lock:
+                self._seeding = False
+            self._seed_done.set()
 
     def ensure_seeded(self) -> None:
         if self._seeded:
@@ -97,10 +136,71 @@ class FlightLedgerRuntime:
             "topics": topics,
         }
 
+    def dashboard_payload_json(self, refresh: bool = False) -> bytes:
+        """Serialize the dashboard payload straight to JSON bytes.
+
+        Per-topic event lists are serialized once via pydantic-core and cached,
+        so repeated dashboard requests only pay for the small envelope.
+        """
+        if refresh:
+            self.refresh(force=True)
+        else:
+            self.ensure_seeded()
+
+        fragments: list[tuple[str, int, bytes]] = []
+        total_events = 0
+        for topic, events in sorted(self._last_bus.topics.items()):
+            serialized = self._topic_json_cache.get(topic)
+            if serialized is None:
+                serialized = _EVENT_LIST_ADAPTER.dump_json(events)
+                self._topic_json_cache[topic] = serialized
+            fragments.append((topic, len(events), serialized))
+            total_events += len(events)
+
+        envelope = orjson.dumps(
+            {
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "bus_backend": os.getenv("FLIGHTLEDGER_BUS_BACKEND", "memory").strip().lower(),
+                "storage_backend": os.getenv("FLIGHTLEDGER_STORAGE_BACKEND", "memory").strip().lower(),
+                "total_channels": len(self._last_channels),
+                "total_topics": len(fragments),
+                "total_events": total_events,
+                "channels": self._last_channels,
+            }
+        )
+
+        # Splice the cached per-topic fragments into the envelope without
+        # re-decoding them: drop the closing brace and append a topics object.
+        body = bytearray(envelope[:-1])
+        body += b',"topics":{'
+        for index, (topic, count, serialized) in enumerate(fragments):
+            if index:
+                body += b","
+            body += orjson.dumps(topic)
+            body += b':{"count":%d,"events":' % count
+            body += serialized
+            body += b"}"
+        body += b"}}"
+        return bytes(body)
+
     def ticket_history(self, ticket_number: str) -> list[dict[str, Any]]:
         self.ensure_seeded()
         return [event.model_dump(mode="json") for event in self.ticket_store.get_history(ticket_number)]
 
+    def ticket_history_stream(self, ticket_number: str) -> Iterator[bytes]:
+        """Yield the history as JSON-array chunks, one event at a time.
+
+        Keeps peak memory flat for long histories and lets the web layer
+        start writing bytes before the whole list is serialized.
+        """
+        self.ensure_seeded()
+        yield b"["
+        for index, event in enumerate(self.ticket_store.get_history(ticket_number)):
+            if index:
+                yield b","
+            yield event.model_dump_json().encode("utf-8")
+        yield b"]"
+
     def ticket_detail(self, ticket_number: str) -> dict[str, Any]:
         self.ensure_seeded()
         state = self.ticket_store.get_current_state(ticket_number)
@@ -114,10 +214,10 @@ class FlightLedgerRuntime:
     def matching_summary(self) -> dict[str, Any]:
         self.ensure_seeded()
         rows = self.matcher.repository.all_rows()
-        matched = len([row for row in rows if row["status"] == "matched"])
-        unmatched_issued = len([row for row in rows if row["status"] == "unmatched_issued"])
-        unmatched_flown = len([row for row in rows if row["status"] == "unmatched_flown"])
-        suspense = len([row for row in rows if row["status"] == "suspense"])
+        matched = sum(1 for status in map(_STATUS, rows) if status == "matched")
+        unmatched_issued = sum(1 for status in map(_STATUS, rows) if status == "unmatched_issued")
+        unmatched_flown = sum(1 for status in map(_STATUS, rows) if status == "unmatched_flown")
+        suspense = sum(1 for status in map(_STATUS, rows) if status == "suspense")
         return {
             "matched": matched,
             "unmatched_issued": unmatched_issued,
@@ -181,17 +281,11 @@ class FlightLedgerRuntime:
         }
 
     def get_dag_run(self, run_id: str) -> dict[str, Any] | None:
-        stub_runner = DAGRunner(
-            dag=list(self._dags.values())[0],
-            audit_store=self.audit,
-            dag_repo=self.dag_run_repo,
-            task_repo=self.task_run_repo,
-        )
-        return stub_runner.get_run(run_id)
+        return self.dag_run_repo.get_run(run_id)
 
-    def settlements(self, status: str | None = None) -> list[dict[str, Any]]:
+    def settlements(self, status: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
         self.ensure_seeded()
-        return self.settlement.list_settlements(status=status)
+        return self.settlement.list_settlements(status=status, limit=limit)
 
     def settlement_saga(self, settlement_id: str) -> list[dict[str, Any]]:
         self.ensure_seeded()
@@ -335,7 +429,7 @@ class FlightLedgerRuntime:
                             "suspense": int(matching_counter.get("suspense", 0)),
                         },
                         "reconciliation": {
-                            "matched": len([row for row in recon_for_passenger if row.get("status") == "matched"]),
+                            "matched": sum(1 for row in recon_for_passenger if row.get("status") == "matched"),
                             "breaks": len(recon_breaks),
                             "break_types": dict(recon_break_types),
                         },
@@ -391,6 +485,7 @@ class FlightLedgerRuntime:
             )
 
         self._last_bus, self._last_channels = ingest_demo(self.data_dir, on_event=on_event)
+        self._topic_json_cache.clear()
 
     def _hydrate_from_existing_supabase(self) -> bool:
         try:
@@ -404,6 +499,7 @@ class FlightLedgerRuntime:
         for event in events:
             bus.publish(event)
         self._last_bus = bus
+        self._topic_json_cache.clear()
 
         # Raw source payloads are unavailable once data already lives in Supabase.
         # Keep channel metadata without payload text for dashboard continuity.
@@ -421,7 +517,7 @@ class FlightLedgerRuntime:
         ]
 
         recon_rows = self.recon.repository.all_rows()
-        total_matched = len([row for row in recon_rows if row.get("status") == "matched"])
+        total_matched = sum(1 for row in recon_rows if row.get("status") == "matched")
         breaks = [row for row in recon_rows if row.get("status") == "break"]
         breaks_by_type: dict[str, int] = {}
         breaks_by_severity: dict[str, int] = {}
@@ -464,21 +560,24 @@ class FlightLedgerRuntime:
             [CanonicalEventType.SETTLEMENT_DUE, CanonicalEventType.INTERLINE_CLAIM]
         )
         for index, event in enumerate(settlement_events):
-            amount = event.gross_amount or Decimal("0")
-            settlement = self.settlement.calculate(
-                ticket_number=event.ticket_number,
-                counterparty=event.metadata.get("partner_carrier") or event.metadata.get("gds") or "counterparty",
-                our_amount=amount if amount > 0 else Decimal("1"),
-            )
-            settlement = self.settlement.validate(settlement.id)
-            settlement = self.settlement.submit(settlement.id)
-            if index % 8 == 0:
-                their_amount = (amount if amount > 0 else Decimal("1")) + Decimal("5")
-                settlement = self.settlement.confirm(settlement.id, their_amount=their_amount)
-                self.settlement.compensate(settlement.id, reason="Disputed amount")
-            else:
-                settlement = self.settlement.confirm(settlement.id, their_amount=amount if amount > 0 else Decimal("1"))
-                self.settlement.reconcile(settlement.id)
+            amount = event.gross_amount or _D_ZERO
+            # Resolve the zero-amount fallback once: a zero our_amount would
+            # stall validate() and make the downstream submit() raise.
+            effective_amount = amount if amount > 0 else _D_ONE
+            with self.settlement.transition_batch():
+                settlement = self.settlement.calculate(
+                    ticket_number=event.ticket_number,
+                    counterparty=event.metadata.get("partner_carrier") or event.metadata.get("gds") or "counterparty",
+                    our_amount=effective_amount,
+                )
+                settlement = self.settlement.validate(settlement.id)
+                settlement = self.settlement.submit(settlement.id)
+                if index % 8 == 0:
+                    settlement = self.settlement.confirm(settlement.id, their_amount=effective_amount + _D_FIVE)
+                    self.settlement.compensate(settlement.id, reason="Disputed amount")
+                else:
+                    settlement = self.settlement.confirm(settlement.id, their_amount=effective_amount)
+                    self.settlement.reconcile(settlement.id)
 
     def _serialize_state(self, state: TicketState) -> dict[str, Any]:
         return {
@@ -497,25 +596,47 @@ class FlightLedgerRuntime:
         }
 
     def _build_dags(self) -> dict[str, DAG]:
+        # Bound methods instead of lambdas: the method is resolved once at DAG
+        # construction rather than on every task execution.
         month_end = DAG(
             name="month_end_close",
             tasks=[
-                Task(name="ingest_all_feeds", depends_on=[], fn=lambda: {"channels": len(self._last_channels)}),
-                Task(name="coupon_matching", depends_on=["ingest_all_feeds"], fn=lambda: self.matching_summary()),
-                Task(name="reconciliation", depends_on=["coupon_matching"], fn=lambda: self.recon_summary()),
-                Task(name="age_suspense", depends_on=["coupon_matching"], fn=lambda: {"aged": self.matcher.age_suspense()}),
-                Task(name="generate_settlements", depends_on=["reconciliation"], fn=lambda: {"count": len(self.settlements())}),
-                Task(name="resolve_breaks", depends_on=["reconciliation"], fn=lambda: {"open_breaks": len(self.recon_breaks())}),
+                Task(name="ingest_all_feeds", depends_on=[], fn=self._ingest_summary),
+                Task(name="coupon_matching", depends_on=["ingest_all_feeds"], fn=self.matching_summary),
+                Task(name="reconciliation", depends_on=["coupon_matching"], fn=self.recon_summary),
+                Task(name="age_suspense", depends_on=["coupon_matching"], fn=self._age_suspense_task),
+                Task(name="generate_settlements", depends_on=["reconciliation"], fn=self._count_settlements),
+                Task(name="resolve_breaks", depends_on=["reconciliation"], fn=self._count_open_breaks),
                 Task(
                     name="revenue_reports",
                     depends_on=["resolve_breaks", "generate_settlements"],
-                    fn=lambda: {"report_id": f"RPT-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"},
+                    fn=self._revenue_report_task,
                 ),
-                Task(name="regulatory_filing", depends_on=["revenue_reports"], fn=lambda: {"status": "submitted"}),
+                Task(name="regulatory_filing", depends_on=["revenue_reports"], fn=self._regulatory_filing_task),
             ],
         )
         return {month_end.name: month_end}
 
+    def _ingest_summary(self) -> dict[str, Any]:
+        return {"channels": len(self._last_channels)}
+
+    def _age_suspense_task(self) -> dict[str, Any]:
+        return {"aged": self.matcher.age_suspense()}
+
+    def _count_settlements(self) -> dict[str, Any]:
+        return {"count": len(self.settlements())}
+
+    def _count_open_breaks(self) -> dict[str, Any]:
+        return {"open_breaks": len(self.recon_breaks())}
+
+    @staticmethod
+    def _revenue_report_task() -> dict[str, Any]:
+        return {"report_id": f"RPT-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"}
+
+    @staticmethod
+    def _regulatory_filing_task() -> dict[str, Any]:
+        return {"status": "submitted"}
+
     @staticmethod
     def _build_passenger_narrative(
         matched: int,
@@ -545,7 +666,7 @@ class FlightLedgerRuntime:
                     "sales_channel": leg.get("sales_channel"),
                     "pnr": leg.get("pnr"),
                     "coupons": 0,
-                    "total_paid": Decimal("0"),
+                    "total_paid": _D_ZERO,
                     "currency": leg.get("currency"),
                     "journey_legs": [],
                 },
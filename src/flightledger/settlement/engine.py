@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import heapq
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any
-from uuid import uuid4
+from operator import itemgetter
+from typing import Any, Iterator
 
 from flightledger.audit.lineage import AuditStore
 from flightledger.db.repositories import SettlementRepository
+from flightledger.ids import pooled_uuid4
+
+# C-level sort key; measurably faster than an equivalent lambda.
+_CREATED_AT = itemgetter("created_at")
+
+# Parsed once; Decimal string parsing allocates digit arrays per call.
+_D_TOL = Decimal("0.01")
 
 
 @dataclass
@@ -28,15 +37,33 @@ class SettlementEngine:
     def __init__(self, repository: SettlementRepository | None = None, audit_store: AuditStore | None = None) -> None:
         self.repository = repository or SettlementRepository()
         self.audit_store = audit_store
+        self._frozen_now: str | None = None
 
     def reset(self) -> None:
         self.repository.reset()
 
+    @contextmanager
+    def transition_batch(self, timestamp: str | None = None) -> Iterator[None]:
+        """Freeze the transition timestamp for a batch of FSM steps.
+
+        Batch callers (bootstrap) do not need distinct stamps per transition,
+        so one isoformat call covers the whole chain.
+        """
+        previous = self._frozen_now
+        self._frozen_now = timestamp or datetime.now(timezone.utc).isoformat()
+        try:
+            yield
+        finally:
+            self._frozen_now = previous
+
+    def _now(self) -> str:
+        return self._frozen_now or datetime.now(timezone.utc).isoformat()
+
     def calculate(self, ticket_number: str, counterparty: str, our_amount: Decimal) -> Settlement:
-        now = datetime.now(timezone.utc).isoformat()
+        now = self._now()
         row = self.repository.insert(
             {
-                "id": str(uuid4()),
+                "id": pooled_uuid4(),
                 "ticket_number": ticket_number,
                 "counterparty": counterparty,
                 "counterparty_type": "interline_partner",
@@ -55,7 +82,9 @@ class SettlementEngine:
         settlement = self._require(settlement_id)
         if settlement["status"] != "calculated":
             raise ValueError("Invalid transition: only 'calculated' can be validated")
-        if Decimal(str(settlement["our_amount"])) <= 0:
+        # Amounts are stored as floats, so compare directly and skip the
+        # Decimal parse on the no-op path.
+        if settlement["our_amount"] <= 0:
             return self._to_settlement(settlement)
         self.repository.update_status(settlement_id, "validated")
         self._log_transition(settlement_id, "calculated", "validated", "validate", {})
@@ -74,7 +103,7 @@ class SettlementEngine:
         if settlement["status"] != "submitted":
             raise ValueError("Invalid transition: only 'submitted' can be confirmed")
         our_amount = Decimal(str(settlement["our_amount"]))
-        status = "confirmed" if (our_amount - their_amount).copy_abs() < Decimal("0.01") else "disputed"
+        status = "confirmed" if (our_amount - their_amount).copy_abs() < _D_TOL else "disputed"
         self.repository.update_status(settlement_id, status, {"their_amount": float(their_amount)})
         self._log_transition(
             settlement_id,
@@ -102,11 +131,14 @@ class SettlementEngine:
         self._log_transition(settlement_id, from_status, "compensated", "compensate", {"reason": reason})
         return self._to_settlement(self._require(settlement_id))
 
-    def list_settlements(self, status: str | None = None) -> list[dict[str, Any]]:
+    def list_settlements(self, status: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
         rows = self.repository.list_all()
         if status:
             rows = [row for row in rows if row["status"] == status]
-        rows.sort(key=lambda row: row["created_at"], reverse=True)
+        if limit is not None and limit < len(rows):
+            # O(N log k) for the top-k newest instead of sorting everything.
+            return heapq.nlargest(limit, rows, key=_CREATED_AT)
+        rows.sort(key=_CREATED_AT, reverse=True)
         return rows
 
     def get_saga(self, settlement_id: str) -> list[dict[str, Any]]:
@@ -127,13 +159,13 @@ class SettlementEngine:
         detail: dict[str, Any],
     ) -> None:
         row = {
-            "id": str(uuid4()),
+            "id": pooled_uuid4(),
             "settlement_id": settlement_id,
             "from_status": from_status,
             "to_status": to_status,
             "action": action,
             "detail": detail,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._now(),
         }
         self.repository.insert_saga(row)
         if self.audit_store:
@@ -1,22 +1,64 @@
 from __future__ import annotations
 
+import heapq
 import random
+from bisect import bisect_left
 import string
 from collections import Counter
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from threading import Lock
 from typing import Any
-from uuid import uuid4
 
 from flightledger.audit.lineage import AuditStore
 from flightledger.db.repositories import AuditRepository, TicketCurrentStateRepository, TicketEventRepository
+from flightledger.ids import pooled_uuid4
 from flightledger.models.canonical import CanonicalEvent, CanonicalEventType, SourceSystem
 from flightledger.stores.ticket_lifecycle import TicketLifecycleStore
 
 SIM_OUTPUT_REFERENCE = "simulation_state"
 SIM_TICKET_PREFIX = "SIM-"
 
+# Full snapshots are re-journaled after this many delta rows so replay on a
+# cold load stays bounded.
+_SNAPSHOT_DELTA_LIMIT = 8
+
+# Weight tables as precomputed cumulative thresholds so picks bisect in
+# O(log n) instead of re-summing the weights per call.
+_SOURCE_VALUES = ("pss_direct", "gds", "ota", "interline")
+_SOURCE_CUM = (0.4, 0.7, 0.9, 1.0)
+_CABIN_VALUES = ("economy", "premium", "business")
+_CABIN_CUM = (0.6, 0.85, 1.0)
+
+_PNR_ALPHABET = string.ascii_uppercase + string.digits
+_PNR_N = len(_PNR_ALPHABET)
+
+# Shared lookup data for ticket generation; callers treat these as
+# read-only, so the hot methods avoid rebuilding the literals per call.
+_FLIGHTS = (
+    {"carrier": "BA", "flight_number": "BA117", "origin": "LHR", "destination": "JFK"},
+    {"carrier": "BA", "flight_number": "BA287", "origin": "LHR", "destination": "SFO"},
+    {"carrier": "AA", "flight_number": "AA100", "origin": "JFK", "destination": "SFO"},
+)
+_AA100 = _FLIGHTS[2]
+_FIRST_NAMES = ("Ava", "Noah", "Mia", "Liam", "Zoe", "Omar", "Ethan", "Ivy", "Lucas", "Sofia")
+_LAST_NAMES = ("Morgan", "Patel", "Chen", "Rossi", "Kim", "Ali", "Nguyen", "Ward", "Garcia", "Hughes")
+_GDS_VENDORS = ("amadeus", "sabre")
+_OTA_VENDORS = ("expedia", "booking.com")
+_INTERLINE_VENDORS = ("AA", "IB", "QR")
+
+_SOURCE_SYSTEM_MAP = {
+    "pss_direct": SourceSystem.PSS,
+    "gds": SourceSystem.GDS,
+    "ota": SourceSystem.OTA,
+    "interline": SourceSystem.INTERLINE,
+}
+
+
+def _pence_to_decimal(pence: int) -> Decimal:
+    """Exact 2dp Decimal from integer pence, with no string round-trip."""
+    return Decimal(pence).scaleb(-2)
+
 
 class FlightSimulationEngine:
     def __init__(self, ticket_store: TicketLifecycleStore, audit_store: AuditStore) -> None:
@@ -27,19 +69,28 @@ class FlightSimulationEngine:
         self.audit_repo = AuditRepository()
         self._lock = Lock()
         self._state_cache: dict[str, Any] | None = None
+        self._deltas_since_snapshot = 0
+        self._snapshot_sim_id: str | None = None
+        self._snapshot_cache: tuple[tuple[int, int, int], dict[str, Any]] | None = None
 
     def get_state(self) -> dict[str, Any]:
+        # Readers only hold the lock long enough to copy the cached state;
+        # the database snapshot scans the repositories and builds outside
+        # the critical section so concurrent reads do not serialize on it.
+        # No public method re-enters another, so a plain Lock (not RLock)
+        # stays correct and cheaper.
         with self._lock:
-            state = self._load_state()
-            state["database"] = self._db_snapshot()
-            return state
+            state = self._peek_state()
+        return {**state, "database": self._db_snapshot()}
 
     def generate_flight(self, seed: int | None = None) -> dict[str, Any]:
         with self._lock:
-            state = self._load_state()
-            if int(state.get("phase_index", -1)) >= 0:
-                state["database"] = self._db_snapshot()
-                return state
+            # Idempotent re-invocations check the cached state directly and
+            # never pay for the copy the write path needs.
+            cached = self._peek_state()
+            if int(cached.get("phase_index", -1)) >= 0:
+                return {**cached, "database": self._db_snapshot()}
+            state = self._load_state_for_write()
 
             rng = random.Random(seed if seed is not None else int(datetime.now(timezone.utc).timestamp()))
             now = datetime.now(timezone.utc)
@@ -53,13 +104,15 @@ class FlightSimulationEngine:
             for index in range(ticket_count):
                 tickets.append(self._generate_ticket(rng=rng, flight=flight, departure_time=departure_time, with_discrepancy=index in discrepancy_indexes))
 
-            total_revenue = sum(Decimal(str(ticket["internal_total_amount"])) for ticket in tickets)
+            # Amounts are already rounded to 2dp, so float arithmetic is exact
+            # enough for the summary metrics without Decimal re-parses.
+            total_revenue = round(sum(ticket["internal_total_amount"] for ticket in tickets), 2)
             total_coupons = sum(len(ticket["legs"]) for ticket in tickets)
-            discrepancy_count = len([ticket for ticket in tickets if Decimal(str(ticket["discrepancy_amount"])) != Decimal("0")])
+            discrepancy_count = sum(1 for ticket in tickets if ticket["discrepancy_amount"] != 0.0)
 
             operations = [
                 {
-                    "id": str(uuid4()),
+                    "id": pooled_uuid4(),
                     "timestamp": now.isoformat(),
                     "phase": "phase_0_generate",
                     "component": "monte_carlo",
@@ -92,7 +145,7 @@ class FlightSimulationEngine:
                     "tickets_generated": ticket_count,
                     "coupons_generated": total_coupons,
                     "potential_breaks": discrepancy_count,
-                    "gross_revenue": float(total_revenue),
+                    "gross_revenue": total_revenue,
                     "bookings_processed": 0,
                     "events_appended": 0,
                 },
@@ -104,19 +157,39 @@ class FlightSimulationEngine:
 
     def process_bookings(self) -> dict[str, Any]:
         with self._lock:
-            state = self._load_state()
-            phase_index = int(state.get("phase_index", -1))
+            cached = self._peek_state()
+            phase_index = int(cached.get("phase_index", -1))
             if phase_index < 0:
                 raise ValueError("Generate a flight first.")
             if phase_index >= 1:
-                state["database"] = self._db_snapshot()
-                return state
+                return {**cached, "database": self._db_snapshot()}
+            state = self._load_state_for_write()
 
             operations = list(state.get("operations", []))
             tickets = state.get("tickets", [])
             events_appended = 0
 
             for ticket in tickets:
+                # Operations for one ticket share a stamp; they do not need
+                # distinct microsecond resolution per logged line.
+                now_iso = datetime.now(timezone.utc).isoformat()
+                # Per-ticket event fields built once and splatted per leg;
+                # metadata is shared since events never mutate it.
+                base_kwargs = {
+                    "source_system": self._source_system(ticket["source_system"]),
+                    "event_type": CanonicalEventType.TICKET_ISSUED,
+                    "ticket_number": ticket["ticket_number"],
+                    "pnr": ticket["pnr"],
+                    "passenger_name": ticket["passenger_name"],
+                    "currency": ticket["currency"],
+                    "metadata": {
+                        "simulation_id": state["simulation_id"],
+                        "simulation_phase": "phase_1_booking",
+                        "source_vendor": ticket["source_vendor"],
+                        "sales_channel": ticket["source_system"],
+                    },
+                }
+                ticket_events: list[CanonicalEvent] = []
                 for leg in ticket["legs"]:
                     raw_record = self._raw_source_example(ticket=ticket, leg=leg)
                     operations.append(
@@ -126,31 +199,22 @@ class FlightSimulationEngine:
                             title="Source Adapter",
                             message=f"{ticket['ticket_number']} normalized from {ticket['source_system']}.",
                             snippet=raw_record,
+                            timestamp=now_iso,
                         )
                     )
 
+                    gross_pence = round(leg["internal_amount"] * 100)
                     event = CanonicalEvent(
-                        source_system=self._source_system(ticket["source_system"]),
-                        event_type=CanonicalEventType.TICKET_ISSUED,
-                        ticket_number=ticket["ticket_number"],
+                        **base_kwargs,
                         coupon_number=leg["coupon_number"],
-                        pnr=ticket["pnr"],
-                        passenger_name=ticket["passenger_name"],
                         marketing_carrier=leg["marketing_carrier"],
                         operating_carrier=leg["operating_carrier"],
                         flight_number=leg["flight_number"],
                         flight_date=leg["flight_date"],
                         origin=leg["origin"],
                         destination=leg["destination"],
-                        currency=ticket["currency"],
-                        gross_amount=Decimal(str(leg["internal_amount"])),
-                        net_amount=(Decimal(str(leg["internal_amount"])) * Decimal("0.95")).quantize(Decimal("0.01")),
-                        metadata={
-                            "simulation_id": state["simulation_id"],
-                            "simulation_phase": "phase_1_booking",
-                            "source_vendor": ticket["source_vendor"],
-                            "sales_channel": ticket["source_system"],
-                        },
+                        gross_amount=_pence_to_decimal(gross_pence),
+                        net_amount=_pence_to_decimal(round(gross_pence * 95 / 100)),
                     )
 
                     operations.append(
@@ -165,38 +229,45 @@ class FlightSimulationEngine:
                                 "coupon_number": event.coupon_number,
                                 "source_system": event.source_system.value,
                             },
+                            timestamp=now_iso,
                         )
                     )
-
-                    self.ticket_store.append(event)
-                    events_appended += 1
-
-                    history = self.ticket_store.get_history(event.ticket_number)
+                    ticket_events.append(event)
+
+                # One batched append per ticket: a single sequence fetch,
+                # bulk insert, and read-model projection for all coupons.
+                self.ticket_store.append_many(ticket_events)
+                events_appended += len(ticket_events)
+
+                # Status and count come straight off the cached state row;
+                # no Pydantic decode of the history just to log a line.
+                status, event_count = self.ticket_store.peek_status(ticket["ticket_number"])
+                base_count = event_count - len(ticket_events)
+                for offset, event in enumerate(ticket_events, start=1):
                     operations.append(
                         self._operation(
                             phase="phase_1_booking",
                             component="event_store",
                             title="Ticket Lifecycle Store",
-                            message=f"Appended event {len(history)} for {event.ticket_number}.",
-                            snippet={"event_count": len(history), "ticket_number": event.ticket_number},
+                            message=f"Appended event {base_count + offset} for {event.ticket_number}.",
+                            snippet={"event_count": base_count + offset, "ticket_number": event.ticket_number},
+                            timestamp=now_iso,
                         )
                     )
-
-                    state_row = self.ticket_store.get_current_state(event.ticket_number)
                     operations.append(
                         self._operation(
                             phase="phase_1_booking",
                             component="cqrs_read_model",
                             title="CQRS Read Model",
-                            message=f"Projected {event.ticket_number} status={state_row.status}.",
+                            message=f"Projected {event.ticket_number} status={status}.",
                             snippet={
                                 "ticket_number": event.ticket_number,
-                                "status": state_row.status,
-                                "event_count": state_row.event_count,
+                                "status": status,
+                                "event_count": event_count,
                             },
+                            timestamp=now_iso,
                         )
                     )
-
                     self.audit_store.log(
                         action="simulation_booking_processed",
                         component="simulation_engine",
@@ -242,7 +313,13 @@ class FlightSimulationEngine:
             state["database"] = self._db_snapshot()
             return state
 
-    def _load_state(self) -> dict[str, Any]:
+    def _peek_state(self) -> dict[str, Any]:
+        """Read-only view of the cached state; callers must not mutate it."""
+        if self._state_cache is None:
+            self._load_state_for_write()
+        return self._state_cache
+
+    def _load_state_for_write(self) -> dict[str, Any]:
         if self._state_cache is not None:
             return dict(self._state_cache)
         rows = self.audit_store.get_lineage(SIM_OUTPUT_REFERENCE)
@@ -250,29 +327,70 @@ class FlightSimulationEngine:
             self._state_cache = self._default_state()
             return dict(self._state_cache)
 
-        latest = sorted(rows, key=lambda row: row.timestamp)[-1]
-        detail = latest.detail or {}
-        state = detail.get("state")
-        if isinstance(state, dict):
-            self._state_cache = state
-            return dict(state)
+        # Lineage rows come back in timestamp order: start from the most
+        # recent full snapshot and replay any deltas journaled after it.
+        snapshot_index: int | None = None
+        for index in range(len(rows) - 1, -1, -1):
+            if rows[index].action == "simulation_state_saved":
+                snapshot_index = index
+                break
+        if snapshot_index is None or not isinstance((rows[snapshot_index].detail or {}).get("state"), dict):
+            self._state_cache = self._default_state()
+            return dict(self._state_cache)
+
+        state = dict(rows[snapshot_index].detail["state"])
+        for row in rows[snapshot_index + 1 :]:
+            if row.action != "simulation_state_delta":
+                continue
+            detail = row.detail or {}
+            operations = list(state.get("operations", []))
+            operations.extend(detail.get("ops_added") or [])
+            state.update(detail.get("delta") or {})
+            state["operations"] = operations
 
-        self._state_cache = self._default_state()
-        return dict(self._state_cache)
+        self._state_cache = state
+        return dict(state)
 
     def _save_state(self, state: dict[str, Any]) -> None:
+        # Journal a delta when only appending to the same simulation; the
+        # serialized bytes then scale with the new operations, not with the
+        # whole accumulated state.
+        previous = self._state_cache
         self._state_cache = dict(state)
+        if (
+            previous is not None
+            and previous.get("simulation_id") == state.get("simulation_id")
+            and self._snapshot_sim_id == state.get("simulation_id")
+            and self._deltas_since_snapshot < _SNAPSHOT_DELTA_LIMIT
+        ):
+            previous_ops = previous.get("operations", [])
+            operations = state.get("operations", [])
+            if len(operations) >= len(previous_ops):
+                self.audit_store.log(
+                    action="simulation_state_delta",
+                    component="simulation_engine",
+                    output_reference=SIM_OUTPUT_REFERENCE,
+                    detail={
+                        "delta": {key: value for key, value in state.items() if key != "operations"},
+                        "ops_added": operations[len(previous_ops) :],
+                    },
+                )
+                self._deltas_since_snapshot += 1
+                return
+
         self.audit_store.log(
             action="simulation_state_saved",
             component="simulation_engine",
             output_reference=SIM_OUTPUT_REFERENCE,
             detail={"state": state},
         )
+        self._deltas_since_snapshot = 0
+        self._snapshot_sim_id = state.get("simulation_id")
 
     def _default_state(self) -> dict[str, Any]:
         now = datetime.now(timezone.utc).isoformat()
         return {
-            "simulation_id": f"sim-{uuid4()}",
+            "simulation_id": f"sim-{pooled_uuid4()}",
             "simulated_time": now,
             "flight": None,
             "phase_index": -1,
@@ -295,21 +413,23 @@ class FlightSimulationEngine:
         }
 
     def _db_snapshot(self) -> dict[str, Any]:
-        ticket_events = self.event_repo.all_rows()
-        sim_ticket_events = [row for row in ticket_events if str(row.get("ticket_number", "")).startswith(SIM_TICKET_PREFIX)]
-        ticket_states = self.state_repo.all_rows()
-        sim_ticket_states = [row for row in ticket_states if str(row.get("ticket_number", "")).startswith(SIM_TICKET_PREFIX)]
-        audit_rows = self.audit_repo.all_rows()
-        simulation_audit = [
-            row
-            for row in audit_rows
-            if str(row.get("ticket_number", "")).startswith(SIM_TICKET_PREFIX)
-            or row.get("component") == "simulation_engine"
-        ]
-
-        source_breakdown = Counter()
-        for row in sim_ticket_events:
-            source_breakdown[str(row.get("source_system", "unknown"))] += 1
+        # Row counts only move on writes, so they make a cheap cache key that
+        # skips the three full-table reads on repeated get_state calls.
+        cache_key = (self.event_repo.count(), self.state_repo.count(), self.audit_repo.count())
+        if self._snapshot_cache is not None and self._snapshot_cache[0] == cache_key:
+            return self._snapshot_cache[1]
+
+        # Prefix filtering happens in the repository layer (LIKE query or
+        # ticket-keyed lookup) rather than a Python scan of every row, and
+        # the totals reuse the counts fetched for the cache key.
+        event_count, state_count, audit_count = cache_key
+        sim_ticket_events = self.event_repo.get_rows_by_ticket_prefix(SIM_TICKET_PREFIX)
+        sim_ticket_states = self.state_repo.get_rows_by_ticket_prefix(SIM_TICKET_PREFIX)
+        simulation_audit = self.audit_repo.get_by_prefix_or_component(SIM_TICKET_PREFIX, "simulation_engine")
+
+        # The generator form dispatches to the C-level _count_elements
+        # instead of a Python-level increment per row.
+        source_breakdown = Counter(str(row.get("source_system", "unknown")) for row in sim_ticket_events)
 
         sample_events = [
             {
@@ -317,27 +437,28 @@ class FlightSimulationEngine:
                 "event_type": row.get("event_type"),
                 "event_sequence": row.get("event_sequence"),
             }
-            for row in sorted(sim_ticket_events, key=lambda item: (item.get("ticket_number", ""), int(item.get("event_sequence", 0))))[:6]
+            for row in heapq.nsmallest(
+                6, sim_ticket_events, key=lambda item: (item.get("ticket_number", ""), int(item.get("event_sequence", 0)))
+            )
         ]
 
-        return {
+        snapshot = {
             "tables": {
-                "ticket_events": {"rows": len(ticket_events), "simulation_rows": len(sim_ticket_events)},
-                "ticket_current_state": {"rows": len(ticket_states), "simulation_rows": len(sim_ticket_states)},
-                "audit_log": {"rows": len(audit_rows), "simulation_rows": len(simulation_audit)},
+                "ticket_events": {"rows": event_count, "simulation_rows": len(sim_ticket_events)},
+                "ticket_current_state": {"rows": state_count, "simulation_rows": len(sim_ticket_states)},
+                "audit_log": {"rows": audit_count, "simulation_rows": len(simulation_audit)},
             },
             "simulation_source_breakdown": dict(source_breakdown),
             "sample_events": sample_events,
         }
+        self._snapshot_cache = (cache_key, snapshot)
+        return snapshot
 
     @staticmethod
     def _pick_flight(rng: random.Random) -> dict[str, str]:
-        flights = [
-            {"carrier": "BA", "flight_number": "BA117", "origin": "LHR", "destination": "JFK"},
-            {"carrier": "BA", "flight_number": "BA287", "origin": "LHR", "destination": "SFO"},
-            {"carrier": "AA", "flight_number": "AA100", "origin": "JFK", "destination": "SFO"},
-        ]
-        return dict(rng.choice(flights))
+        # Callers only read from the flight dict, so the shared constant
+        # can be handed out without a defensive copy.
+        return rng.choice(_FLIGHTS)
 
     def _generate_ticket(
         self,
@@ -346,49 +467,42 @@ class FlightSimulationEngine:
         departure_time: datetime,
         with_discrepancy: bool,
     ) -> dict[str, Any]:
-        source_system = self._pick_weighted(
-            rng=rng,
-            weights=[
-                ("pss_direct", 0.4),
-                ("gds", 0.3),
-                ("ota", 0.2),
-                ("interline", 0.1),
-            ],
-        )
-        cabin = self._pick_weighted(
-            rng=rng,
-            weights=[
-                ("economy", 0.6),
-                ("premium", 0.25),
-                ("business", 0.15),
-            ],
-        )
-        base_amount = self._sample_price(rng, cabin)
-        discrepancy = Decimal("0")
+        source_system = self._pick_weighted(rng, _SOURCE_VALUES, _SOURCE_CUM)
+        cabin = self._pick_weighted(rng, _CABIN_VALUES, _CABIN_CUM)
+        # Monetary values are GBP 2dp, so the whole generation path runs on
+        # integer pence; Decimal only appears at the CanonicalEvent boundary.
+        base_pence = self._sample_price_pence(rng, cabin)
+        discrepancy_pence = 0
         if with_discrepancy:
-            discrepancy = Decimal(str(rng.randint(2, 15)))
+            discrepancy_pence = rng.randint(2, 15) * 100
             if rng.random() < 0.5:
-                discrepancy *= Decimal("-1")
+                discrepancy_pence = -discrepancy_pence
 
         vendor = self._vendor_for_source(rng, source_system)
-        legs = [self._build_leg(flight=flight, coupon_number=1, amount=base_amount, departure_time=departure_time)]
+        internal_total_pence = base_pence
+        legs = [self._build_leg(flight=flight, coupon_number=1, pence=base_pence, departure_time=departure_time)]
         if rng.random() < 0.35:
+            connection_pence = base_pence * 55 // 100
+            internal_total_pence += connection_pence
             legs.append(
                 self._build_leg(
-                    flight={"carrier": "AA", "flight_number": "AA100", "origin": "JFK", "destination": "SFO"},
+                    flight=_AA100,
                     coupon_number=2,
-                    amount=(base_amount * Decimal("0.55")).quantize(Decimal("0.01")),
+                    pence=connection_pence,
                     departure_time=departure_time + timedelta(hours=8),
                 )
             )
-
-        internal_total = sum(Decimal(str(leg["internal_amount"])) for leg in legs)
-        external_total = internal_total + discrepancy
+        external_total_pence = internal_total_pence + discrepancy_pence
         ticket_number = f"{SIM_TICKET_PREFIX}{datetime.now(timezone.utc).strftime('%m%d')}{rng.randint(100000, 999999)}"
-        pnr = "".join(rng.choices(string.ascii_uppercase + string.digits, k=6))
-        first_names = ["Ava", "Noah", "Mia", "Liam", "Zoe", "Omar", "Ethan", "Ivy", "Lucas", "Sofia"]
-        last_names = ["Morgan", "Patel", "Chen", "Rossi", "Kim", "Ali", "Nguyen", "Ward", "Garcia", "Hughes"]
-        passenger_name = f"{rng.choice(first_names)} {rng.choice(last_names)}"
+        # One getrandbits call covers all six base-36 digits; rng.choices
+        # would run six random() draws plus bisects per PNR.
+        n = rng.getrandbits(36)
+        pnr_chars = []
+        for _ in range(6):
+            n, r = divmod(n, _PNR_N)
+            pnr_chars.append(_PNR_ALPHABET[r])
+        pnr = "".join(pnr_chars)
+        passenger_name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
 
         return {
             "ticket_number": ticket_number,
@@ -398,14 +512,14 @@ class FlightSimulationEngine:
             "source_vendor": vendor,
             "cabin_class": cabin,
             "currency": "GBP",
-            "internal_total_amount": float(internal_total),
-            "external_reported_amount": float(external_total),
-            "discrepancy_amount": float(discrepancy),
+            "internal_total_amount": internal_total_pence / 100,
+            "external_reported_amount": external_total_pence / 100,
+            "discrepancy_amount": discrepancy_pence / 100,
             "legs": legs,
         }
 
     @staticmethod
-    def _build_leg(flight: dict[str, str], coupon_number: int, amount: Decimal, departure_time: datetime) -> dict[str, Any]:
+    def _build_leg(flight: dict[str, str], coupon_number: int, pence: int, departure_time: datetime) -> dict[str, Any]:
         return {
             "coupon_number": coupon_number,
             "flight_number": flight["flight_number"],
@@ -414,21 +528,15 @@ class FlightSimulationEngine:
             "origin": flight["origin"],
             "destination": flight["destination"],
             "flight_date": departure_time.date().isoformat(),
-            "internal_amount": float(amount.quantize(Decimal("0.01"))),
+            "internal_amount": pence / 100,
         }
 
     @staticmethod
-    def _pick_weighted(rng: random.Random, weights: list[tuple[str, float]]) -> str:
-        roll = rng.random()
-        cumulative = 0.0
-        for value, weight in weights:
-            cumulative += weight
-            if roll <= cumulative:
-                return value
-        return weights[-1][0]
+    def _pick_weighted(rng: random.Random, values: tuple[str, ...], cum_weights: tuple[float, ...]) -> str:
+        return values[bisect_left(cum_weights, rng.random())]
 
     @staticmethod
-    def _sample_price(rng: random.Random, cabin: str) -> Decimal:
+    def _sample_price_pence(rng: random.Random, cabin: str) -> int:
         if cabin == "business":
             mean, std_dev, floor, ceil = 4500, 900, 3000, 6000
         elif cabin == "premium":
@@ -438,27 +546,21 @@ class FlightSimulationEngine:
 
         sampled = rng.gauss(mean, std_dev)
         clamped = max(floor, min(ceil, sampled))
-        return Decimal(str(round(clamped, 2)))
+        return round(clamped * 100)
 
     @staticmethod
     def _vendor_for_source(rng: random.Random, source_system: str) -> str:
         if source_system == "pss_direct":
             return "ba.com"
         if source_system == "gds":
-            return rng.choice(["amadeus", "sabre"])
+            return rng.choice(_GDS_VENDORS)
         if source_system == "ota":
-            return rng.choice(["expedia", "booking.com"])
-        return rng.choice(["AA", "IB", "QR"])
+            return rng.choice(_OTA_VENDORS)
+        return rng.choice(_INTERLINE_VENDORS)
 
     @staticmethod
     def _source_system(source_system: str) -> SourceSystem:
-        if source_system == "pss_direct":
-            return SourceSystem.PSS
-        if source_system == "gds":
-            return SourceSystem.GDS
-        if source_system == "ota":
-            return SourceSystem.OTA
-        return SourceSystem.INTERLINE
+        return _SOURCE_SYSTEM_MAP.get(source_system, SourceSystem.INTERLINE)
 
     @staticmethod
     def _raw_source_example(ticket: dict[str, Any], leg: dict[str, Any]) -> dict[str, Any]:
@@ -492,10 +594,17 @@ class FlightSimulationEngine:
         }
 
     @staticmethod
-    def _operation(phase: str, component: str, title: str, message: str, snippet: dict[str, Any]) -> dict[str, Any]:
+    def _operation(
+        phase: str,
+        component: str,
+        title: str,
+        message: str,
+        snippet: dict[str, Any],
+        timestamp: str | None = None,
+    ) -> dict[str, Any]:
         return {
-            "id": str(uuid4()),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "id": pooled_uuid4(),
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
             "phase": phase,
             "component": component,
             "title": title,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any
+from typing import Any, Iterable
 from uuid import uuid4
 
 from flightledger.db.repositories import TicketCurrentStateRepository, TicketEventRepository
@@ -29,7 +29,11 @@ class TicketState:
 def _to_datetime(value: str | datetime) -> datetime:
     if isinstance(value, datetime):
         return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
-    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    # Only rewrite the suffix when it is actually present; the blanket
+    # str.replace allocated a copy of every already-offset timestamp.
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
     return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
@@ -69,10 +73,14 @@ class TicketLifecycleStore:
     ) -> None:
         self.event_repository = event_repository or TicketEventRepository()
         self.state_repository = state_repository or TicketCurrentStateRepository()
+        # Events appended in-process, keyed by event_id, so history and
+        # replay reads can skip the model_validate round-trip.
+        self._event_cache: dict[str, CanonicalEvent] = {}
 
     def reset(self) -> None:
         self.event_repository.reset()
         self.state_repository.reset()
+        self._event_cache.clear()
 
     def append(self, event: CanonicalEvent) -> None:
         existing = self.event_repository.find_by_event_id(event.event_id)
@@ -80,6 +88,9 @@ class TicketLifecycleStore:
             return
 
         sequence = self.event_repository.next_sequence(event.ticket_number)
+        # Apply just this event on top of the current snapshot instead of
+        # replaying the whole history, which made append O(events) per call.
+        current_state = self.get_current_state(event.ticket_number)
         row = {
             "id": str(uuid4()),
             "ticket_number": event.ticket_number,
@@ -87,16 +98,54 @@ class TicketLifecycleStore:
             "event_type": event.event_type.value,
             "source_system": event.source_system.value,
             "occurred_at": event.occurred_at.isoformat(),
-            "payload": event.model_dump(mode="json"),
+            "payload": event.dump_payload(),
             "ingested_at": datetime.now(timezone.utc).isoformat(),
         }
         self.event_repository.insert(row)
-        current_state = self._replay(self.event_repository.get_by_ticket(event.ticket_number), event.ticket_number)
+        self._event_cache[event.event_id] = event
+        self._apply_event(current_state, event)
         self.state_repository.upsert(self._to_state_row(current_state))
 
+    def append_many(self, events: Iterable[CanonicalEvent]) -> None:
+        """Append a batch of events with one projection pass per ticket.
+
+        Amortizes the sequence fetch, repository insert, and read-model upsert
+        that ``append`` pays per event.
+        """
+        seen: set[str] = set()
+        by_ticket: dict[str, list[CanonicalEvent]] = {}
+        for event in events:
+            if event.event_id in seen or self.event_repository.find_by_event_id(event.event_id):
+                continue
+            seen.add(event.event_id)
+            by_ticket.setdefault(event.ticket_number, []).append(event)
+
+        ingested_at = datetime.now(timezone.utc).isoformat()
+        for ticket_number, ticket_events in by_ticket.items():
+            current_state = self.get_current_state(ticket_number)
+            start_sequence = self.event_repository.next_sequence(ticket_number)
+            rows = [
+                {
+                    "id": str(uuid4()),
+                    "ticket_number": ticket_number,
+                    "event_sequence": start_sequence + offset,
+                    "event_type": event.event_type.value,
+                    "source_system": event.source_system.value,
+                    "occurred_at": event.occurred_at.isoformat(),
+                    "payload": event.dump_payload(),
+                    "ingested_at": ingested_at,
+                }
+                for offset, event in enumerate(ticket_events)
+            ]
+            self.event_repository.insert_many(rows)
+            for event in ticket_events:
+                self._event_cache[event.event_id] = event
+                self._apply_event(current_state, event)
+            self.state_repository.upsert(self._to_state_row(current_state))
+
     def get_history(self, ticket_number: str) -> list[CanonicalEvent]:
         rows = self.event_repository.get_by_ticket(ticket_number)
-        return [_event_from_row(row) for row in rows]
+        return [self._decode_row(row) for row in rows]
 
     def get_current_state(self, ticket_number: str) -> TicketState:
         snapshot = self.state_repository.get(ticket_number)
@@ -105,13 +154,25 @@ class TicketLifecycleStore:
         rows = self.event_repository.get_by_ticket(ticket_number)
         return self._replay(rows, ticket_number)
 
+    def peek_status(self, ticket_number: str) -> tuple[str, int]:
+        """Return ``(status, event_count)`` without building a ``TicketState``.
+
+        Reads straight off the cached state row for callers that only log a
+        status line and do not need the full snapshot decoded.
+        """
+        snapshot = self.state_repository.get(ticket_number)
+        if snapshot:
+            return snapshot.get("status", "unknown"), int(snapshot.get("event_count", 0))
+        state = self.get_current_state(ticket_number)
+        return state.status, state.event_count
+
     def get_state_at(self, ticket_number: str, as_of: datetime) -> TicketState:
         rows = self.event_repository.get_by_ticket_at(ticket_number, as_of)
         return self._replay(rows, ticket_number)
 
     def get_events_by_type(self, event_types: list[CanonicalEventType]) -> list[CanonicalEvent]:
         rows = self.event_repository.get_by_event_types([item.value for item in event_types])
-        return [_event_from_row(row) for row in rows]
+        return [self._decode_row(row) for row in rows]
 
     def get_persisted_event_row_id(self, canonical_event_id: str) -> str | None:
         row = self.event_repository.find_by_event_id(canonical_event_id)
@@ -121,43 +182,61 @@ class TicketLifecycleStore:
 
     def all_events(self) -> list[CanonicalEvent]:
         rows = self.event_repository.all_rows()
-        return [_event_from_row(row) for row in rows]
+        return [self._decode_row(row) for row in rows]
+
+    def _decode_row(self, row: dict[str, Any]) -> CanonicalEvent:
+        """Return the original event instance when this store appended it.
+
+        Falls back to ``model_validate`` for rows written by another
+        process (e.g. rows hydrated from Supabase).
+        """
+        event_id = (row.get("payload") or {}).get("event_id")
+        cached = self._event_cache.get(event_id) if event_id else None
+        if cached is not None:
+            return cached
+        event = _event_from_row(row)
+        if event_id:
+            self._event_cache[event_id] = event
+        return event
 
     def _replay(self, rows: list[dict[str, Any]], ticket_number: str) -> TicketState:
         state = TicketState(ticket_number=ticket_number)
         for row in rows:
-            event = _event_from_row(row)
-            state.event_count += 1
-            state.last_event_type = event.event_type.value
-            state.last_modified = event.occurred_at
-            state.pnr = event.pnr or state.pnr
-            state.passenger_name = event.passenger_name or state.passenger_name
-            state.origin = event.origin or state.origin
-            state.destination = event.destination or state.destination
-            state.currency = event.currency or state.currency
-            if event.gross_amount is not None:
-                state.current_amount = event.gross_amount
-            if event.coupon_number is not None and event.event_type in {
-                CanonicalEventType.TICKET_ISSUED,
-                CanonicalEventType.TICKET_REISSUED,
-            }:
-                state.coupon_statuses[event.coupon_number] = "issued"
-            if event.event_type == CanonicalEventType.TICKET_ISSUED:
-                state.status = "issued"
-            elif event.event_type == CanonicalEventType.TICKET_REISSUED:
-                state.status = "reissued"
-            elif event.event_type == CanonicalEventType.TICKET_VOIDED:
-                state.status = "voided"
-            elif event.event_type == CanonicalEventType.COUPON_FLOWN:
-                state.status = "flown"
-                if event.coupon_number is not None:
-                    state.coupon_statuses[event.coupon_number] = "flown"
-            elif event.event_type == CanonicalEventType.REFUND_REQUESTED:
-                state.status = "refunded"
-            elif event.event_type == CanonicalEventType.BOOKING_MODIFIED and state.status == "unknown":
-                state.status = "modified"
+            self._apply_event(state, self._decode_row(row))
         return state
 
+    @staticmethod
+    def _apply_event(state: TicketState, event: CanonicalEvent) -> None:
+        state.event_count += 1
+        state.last_event_type = event.event_type.value
+        state.last_modified = event.occurred_at
+        state.pnr = event.pnr or state.pnr
+        state.passenger_name = event.passenger_name or state.passenger_name
+        state.origin = event.origin or state.origin
+        state.destination = event.destination or state.destination
+        state.currency = event.currency or state.currency
+        if event.gross_amount is not None:
+            state.current_amount = event.gross_amount
+        if event.coupon_number is not None and event.event_type in {
+            CanonicalEventType.TICKET_ISSUED,
+            CanonicalEventType.TICKET_REISSUED,
+        }:
+            state.coupon_statuses[event.coupon_number] = "issued"
+        if event.event_type == CanonicalEventType.TICKET_ISSUED:
+            state.status = "issued"
+        elif event.event_type == CanonicalEventType.TICKET_REISSUED:
+            state.status = "reissued"
+        elif event.event_type == CanonicalEventType.TICKET_VOIDED:
+            state.status = "voided"
+        elif event.event_type == CanonicalEventType.COUPON_FLOWN:
+            state.status = "flown"
+            if event.coupon_number is not None:
+                state.coupon_statuses[event.coupon_number] = "flown"
+        elif event.event_type == CanonicalEventType.REFUND_REQUESTED:
+            state.status = "refunded"
+        elif event.event_type == CanonicalEventType.BOOKING_MODIFIED and state.status == "unknown":
+            state.status = "modified"
+
     @staticmethod
     def _to_state_row(state: TicketState) -> dict[str, Any]:
         return {
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "mock"
+
+
+@pytest.fixture(scope="session")
+def data_dir() -> Path:
+    return DATA_DIR
+
+
+@pytest.fixture
+def seeded_store():
+    """Factory yielding a fresh store batch-loaded with the given events.
+
+    Seeding goes through append_many so setup pays one projection pass per
+    ticket instead of a Python-level append per event.
+    """
+    from flightledger.stores.ticket_lifecycle import TicketLifecycleStore
+
+    def _seed(events):
+        store = TicketLifecycleStore()
+        store.reset()
+        store.append_many(events)
+        return store
+
+    return _seed
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """One TestClient for the whole run; app bootstrap happens once."""
+    from flightledger.api import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def mock_payloads() -> dict[str, str]:
+    """Mock source payloads keyed by filename, read from disk once per run."""
+    return {path.name: path.read_text(encoding="utf-8") for path in DATA_DIR.glob("*")}
@@ -1,5 +1,3 @@
-from pathlib import Path
-
 from flightledger.adapters import (
     DcsStreamAdapter,
     GdsXmlAdapter,
@@ -10,45 +8,37 @@ from flightledger.adapters import (
 from flightledger.models.canonical import CanonicalEventType, SourceSystem
 
 
-DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "mock"
-
-
-def test_pss_csv_adapter_parses_ticket_events() -> None:
-    payload = (DATA_DIR / "pss_tickets.csv").read_text(encoding="utf-8")
-    events = PssCsvAdapter().parse(payload)
+def test_pss_csv_adapter_parses_ticket_events(mock_payloads: dict[str, str]) -> None:
+    events = PssCsvAdapter().parse(mock_payloads["pss_tickets.csv"])
     assert len(events) == 10
     assert events[0].source_system == SourceSystem.PSS
     assert events[0].event_type == CanonicalEventType.TICKET_ISSUED
     assert events[0].metadata["sales_channel"] == "direct"
 
 
-def test_dcs_stream_adapter_parses_coupon_flown() -> None:
-    payload = (DATA_DIR / "dcs_coupon_flown.json").read_text(encoding="utf-8")
-    events = DcsStreamAdapter().parse(payload)
+def test_dcs_stream_adapter_parses_coupon_flown(mock_payloads: dict[str, str]) -> None:
+    events = DcsStreamAdapter().parse(mock_payloads["dcs_coupon_flown.json"])
     assert len(events) == 8
     assert events[0].source_system == SourceSystem.DCS
     assert events[0].event_type == CanonicalEventType.COUPON_FLOWN
 
 
-def test_gds_xml_adapter_parses_settlement_due() -> None:
-    payload = (DATA_DIR / "gds_settlements.xml").read_text(encoding="utf-8")
-    events = GdsXmlAdapter().parse(payload)
+def test_gds_xml_adapter_parses_settlement_due(mock_payloads: dict[str, str]) -> None:
+    events = GdsXmlAdapter().parse(mock_payloads["gds_settlements.xml"])
     assert len(events) == 7
     assert events[0].source_system == SourceSystem.GDS
     assert events[0].event_type == CanonicalEventType.SETTLEMENT_DUE
 
 
-def test_ota_webhook_adapter_parses_booking_modified() -> None:
-    payload = (DATA_DIR / "ota_webhook.json").read_text(encoding="utf-8")
-    events = OtaWebhookAdapter().parse(payload)
+def test_ota_webhook_adapter_parses_booking_modified(mock_payloads: dict[str, str]) -> None:
+    events = OtaWebhookAdapter().parse(mock_payloads["ota_webhook.json"])
     assert len(events) == 4
     assert events[0].source_system == SourceSystem.OTA
     assert events[0].event_type == CanonicalEventType.BOOKING_MODIFIED
 
 
-def test_interline_adapter_parses_claims() -> None:
-    payload = (DATA_DIR / "interline_claims.json").read_text(encoding="utf-8")
-    events = InterlineRestAdapter().parse(payload)
+def test_interline_adapter_parses_claims(mock_payloads: dict[str, str]) -> None:
+    events = InterlineRestAdapter().parse(mock_payloads["interline_claims.json"])
     assert len(events) == 4
     assert events[0].source_system == SourceSystem.INTERLINE
     assert events[0].event_type == CanonicalEventType.INTERLINE_CLAIM
@@ -1,67 +1,82 @@
+import io
+
+import httpx
+import ijson
+import orjson
 from fastapi.testclient import TestClient
 
-from flightledger.api import app
+
+def _json(response: httpx.Response):
+    """Decode the wire bytes with orjson; stdlib loads dominates this test."""
+    return orjson.loads(response.content)
 
 
-def test_phase2_endpoints_smoke() -> None:
-    client = TestClient(app)
+def test_phase2_endpoints_smoke(api_client: TestClient) -> None:
+    client = api_client
 
     dashboard = client.get("/api/dashboard")
     assert dashboard.status_code == 200
-    ticket_number = dashboard.json()["topics"]["ticket.issued"]["events"][0]["ticket_number"]
+    # Only one field of the dashboard document is needed, so stream-parse
+    # and bail out at the first ticket_number instead of decoding it all.
+    ticket_number = next(
+        ijson.items(io.BytesIO(dashboard.content), "topics.ticket.issued.events.item.ticket_number")
+    )
 
     ticket = client.get(f"/api/tickets/{ticket_number}")
     assert ticket.status_code == 200
-    assert ticket.json()["ticket_number"] == ticket_number
+    assert _json(ticket)["ticket_number"] == ticket_number
 
     history = client.get(f"/api/tickets/{ticket_number}/history")
     assert history.status_code == 200
-    assert isinstance(history.json(), list)
+    assert isinstance(_json(history), list)
 
     matching_summary = client.get("/api/matching/summary")
     assert matching_summary.status_code == 200
-    assert "matched" in matching_summary.json()
+    assert "matched" in _json(matching_summary)
 
     matching_suspense = client.get("/api/matching/suspense")
     assert matching_suspense.status_code == 200
 
     recon_summary = client.get("/api/recon/summary")
     assert recon_summary.status_code == 200
-    assert "total_breaks" in recon_summary.json()
+    assert "total_breaks" in _json(recon_summary)
 
     recon_breaks = client.get("/api/recon/breaks")
     assert recon_breaks.status_code == 200
-    breaks = recon_breaks.json()
-    if breaks:
-        break_id = breaks[0]["id"]
-        resolved = client.post(
-            f"/api/recon/breaks/{break_id}/resolve",
-            json={"resolution": "manually_resolved", "notes": "test"},
-        )
-        assert resolved.status_code == 200
+    # The mock fixture data is fixed, so the pipeline always produces breaks
+    # and settlements; assert that instead of guarding, so the resolve and
+    # saga branches are exercised on every run.
+    breaks = _json(recon_breaks)
+    assert breaks
+    break_id = breaks[0]["id"]
+    resolved = client.post(
+        f"/api/recon/breaks/{break_id}/resolve",
+        json={"resolution": "manually_resolved", "notes": "test"},
+    )
+    assert resolved.status_code == 200
 
     audit = client.get(f"/api/audit/{ticket_number}")
     assert audit.status_code == 200
 
     dags = client.get("/api/orchestrator/dags")
     assert dags.status_code == 200
-    dag_name = dags.json()[0]["name"]
+    dag_name = _json(dags)[0]["name"]
     run = client.post(f"/api/orchestrator/run/{dag_name}")
     assert run.status_code == 200
-    run_id = run.json()["run_id"]
+    run_id = _json(run)["run_id"]
     run_status = client.get(f"/api/orchestrator/runs/{run_id}")
     assert run_status.status_code == 200
 
     settlements = client.get("/api/settlements")
     assert settlements.status_code == 200
-    settlement_rows = settlements.json()
-    if settlement_rows:
-        saga = client.get(f"/api/settlements/{settlement_rows[0]['id']}/saga")
-        assert saga.status_code == 200
+    settlement_rows = _json(settlements)
+    assert settlement_rows
+    saga = client.get(f"/api/settlements/{settlement_rows[0]['id']}/saga")
+    assert saga.status_code == 200
 
     walkthroughs = client.get("/api/walkthroughs")
     assert walkthroughs.status_code == 200
-    walkthrough_rows = walkthroughs.json()
+    walkthrough_rows = _json(walkthroughs)
     assert len(walkthrough_rows) == 6
     assert "purchase_summary" in walkthrough_rows[0]
     assert "result_meaning" in walkthrough_rows[0]
@@ -71,12 +86,12 @@ def test_phase2_endpoints_smoke() -> None:
 
     generated = client.post("/api/simulation/generate-flight")
     assert generated.status_code == 200
-    assert generated.json()["phase_index"] >= 0
+    assert _json(generated)["phase_index"] >= 0
 
     processed = client.post("/api/simulation/process-bookings")
     assert processed.status_code == 200
-    assert processed.json()["phase_index"] >= 1
+    assert _json(processed)["phase_index"] >= 1
 
     reset = client.post("/api/simulation/reset")
     assert reset.status_code == 200
-    assert reset.json()["phase_index"] == -1
+    assert _json(reset)["phase_index"] == -1
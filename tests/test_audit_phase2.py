@@ -4,9 +4,13 @@ from flightledger.audit.lineage import AuditStore
 def test_audit_history_ordering() -> None:
     store = AuditStore()
     store.reset()
-    store.log(action="ingested", component="adapter", ticket_number="1251")
-    store.log(action="matched", component="coupon_matcher", ticket_number="1251")
-    store.log(action="reconciled", component="reconciliation", ticket_number="1251")
+    store.bulk_log(
+        [
+            {"action": "ingested", "component": "adapter", "ticket_number": "1251"},
+            {"action": "matched", "component": "coupon_matcher", "ticket_number": "1251"},
+            {"action": "reconciled", "component": "reconciliation", "ticket_number": "1251"},
+        ]
+    )
 
     history = store.get_history("1251")
     assert len(history) == 3
@@ -16,8 +20,12 @@ def test_audit_history_ordering() -> None:
 def test_audit_lineage_lookup() -> None:
     store = AuditStore()
     store.reset()
-    store.log(action="classified", component="reconciliation", output_reference="recon-1")
-    store.log(action="resolved", component="reconciliation", output_reference="recon-1")
+    store.bulk_log(
+        [
+            {"action": "classified", "component": "reconciliation", "output_reference": "recon-1"},
+            {"action": "resolved", "component": "reconciliation", "output_reference": "recon-1"},
+        ]
+    )
     lineage = store.get_lineage("recon-1")
     assert len(lineage) == 2
 
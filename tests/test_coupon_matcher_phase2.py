@@ -3,38 +3,51 @@ from uuid import UUID
 
 from flightledger.matching.coupon_matcher import CouponMatcher
 from flightledger.models.canonical import CanonicalEvent, CanonicalEventType, SourceSystem
-from flightledger.stores.ticket_lifecycle import TicketLifecycleStore
+
+
+# Ticket numbers precomputed once; the loops just iterate the tuples.
+_TICKETS_A = tuple(f"1250000000{index:02d}" for index in range(1, 6))
+_TICKETS_B = tuple(f"1250000001{index:02d}" for index in range(1, 6))
+_TICKETS_C = tuple(f"1250000002{index:02d}" for index in range(1, 6))
+
+# Validated once at import; helpers copy with field updates instead of
+# re-running the full pydantic validation pass per event.
+_ISSUED_TEMPLATE = CanonicalEvent(
+    event_id="iss-template",
+    occurred_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+    source_system=SourceSystem.PSS,
+    event_type=CanonicalEventType.TICKET_ISSUED,
+    ticket_number="template",
+    coupon_number=1,
+)
+_FLOWN_TEMPLATE = CanonicalEvent(
+    event_id="flw-template",
+    occurred_at=datetime(2026, 3, 2, tzinfo=timezone.utc),
+    source_system=SourceSystem.DCS,
+    event_type=CanonicalEventType.COUPON_FLOWN,
+    ticket_number="template",
+    coupon_number=1,
+)
 
 
 def _issued(ticket: str, coupon: int) -> CanonicalEvent:
-    return CanonicalEvent(
-        event_id=f"iss-{ticket}-{coupon}",
-        occurred_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
-        source_system=SourceSystem.PSS,
-        event_type=CanonicalEventType.TICKET_ISSUED,
-        ticket_number=ticket,
-        coupon_number=coupon,
+    return _ISSUED_TEMPLATE.model_copy(
+        update={"event_id": f"iss-{ticket}-{coupon}", "ticket_number": ticket, "coupon_number": coupon}
     )
 
 
 def _flown(ticket: str, coupon: int) -> CanonicalEvent:
-    return CanonicalEvent(
-        event_id=f"flw-{ticket}-{coupon}",
-        occurred_at=datetime(2026, 3, 2, tzinfo=timezone.utc),
-        source_system=SourceSystem.DCS,
-        event_type=CanonicalEventType.COUPON_FLOWN,
-        ticket_number=ticket,
-        coupon_number=coupon,
+    return _FLOWN_TEMPLATE.model_copy(
+        update={"event_id": f"flw-{ticket}-{coupon}", "ticket_number": ticket, "coupon_number": coupon}
     )
 
 
-def test_coupon_matcher_all_matched() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    for index in range(1, 6):
-        ticket = f"1250000000{index:02d}"
-        store.append(_issued(ticket, 1))
-        store.append(_flown(ticket, 1))
+def test_coupon_matcher_all_matched(seeded_store) -> None:
+    events = []
+    for ticket in _TICKETS_A:
+        events.append(_issued(ticket, 1))
+        events.append(_flown(ticket, 1))
+    store = seeded_store(events)
 
     matcher = CouponMatcher(store)
     result = matcher.run_matching()
@@ -43,14 +56,13 @@ def test_coupon_matcher_all_matched() -> None:
     assert result.unmatched_flown == 0
 
 
-def test_coupon_matcher_unmatched_issued() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    for index in range(1, 6):
-        ticket = f"1250000001{index:02d}"
-        store.append(_issued(ticket, 1))
+def test_coupon_matcher_unmatched_issued(seeded_store) -> None:
+    events = []
+    for index, ticket in enumerate(_TICKETS_B, start=1):
+        events.append(_issued(ticket, 1))
         if index <= 3:
-            store.append(_flown(ticket, 1))
+            events.append(_flown(ticket, 1))
+    store = seeded_store(events)
 
     matcher = CouponMatcher(store)
     result = matcher.run_matching()
@@ -59,14 +71,13 @@ def test_coupon_matcher_unmatched_issued() -> None:
     assert result.unmatched_flown == 0
 
 
-def test_coupon_matcher_unmatched_flown() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    for index in range(1, 6):
-        ticket = f"1250000002{index:02d}"
+def test_coupon_matcher_unmatched_flown(seeded_store) -> None:
+    events = []
+    for index, ticket in enumerate(_TICKETS_C, start=1):
         if index <= 3:
-            store.append(_issued(ticket, 1))
-        store.append(_flown(ticket, 1))
+            events.append(_issued(ticket, 1))
+        events.append(_flown(ticket, 1))
+    store = seeded_store(events)
 
     matcher = CouponMatcher(store)
     result = matcher.run_matching()
@@ -75,10 +86,8 @@ def test_coupon_matcher_unmatched_flown() -> None:
     assert result.unmatched_flown == 2
 
 
-def test_coupon_matcher_age_suspense() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    store.append(_issued("125999999001", 1))
+def test_coupon_matcher_age_suspense(seeded_store) -> None:
+    store = seeded_store([_issued("125999999001", 1)])
 
     matcher = CouponMatcher(store)
     matcher.run_matching()
@@ -90,11 +99,8 @@ def test_coupon_matcher_age_suspense() -> None:
     assert suspense_items[0]["days_in_suspense"] == 2
 
 
-def test_coupon_matcher_uses_persisted_event_row_ids_for_foreign_keys() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    store.append(_issued("125999999002", 1))
-    store.append(_flown("125999999002", 1))
+def test_coupon_matcher_uses_persisted_event_row_ids_for_foreign_keys(seeded_store) -> None:
+    store = seeded_store([_issued("125999999002", 1), _flown("125999999002", 1)])
 
     matcher = CouponMatcher(store)
     matcher.run_matching()
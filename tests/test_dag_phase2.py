@@ -3,6 +3,10 @@ import pytest
 from flightledger.orchestrator.dag import DAG, DAGRunner, Task
 
 
+def _status(result, name: str) -> str:
+    return next(task.status for task in result.task_results if task.task_name == name)
+
+
 def test_dag_execution_order_linear() -> None:
     dag = DAG(
         name="linear",
@@ -29,10 +33,9 @@ def test_dag_skip_downstream_on_failure() -> None:
         ],
     )
     result = DAGRunner(dag).run()
-    statuses = {task.task_name: task.status for task in result.task_results}
-    assert statuses["A"] == "failed"
-    assert statuses["B"] == "skipped"
-    assert statuses["C"] == "skipped"
+    assert _status(result, "A") == "failed"
+    assert _status(result, "B") == "skipped"
+    assert _status(result, "C") == "skipped"
 
 
 def test_dag_cycle_detection() -> None:
@@ -48,19 +51,25 @@ def test_dag_cycle_detection() -> None:
 
 
 def test_dag_task_waits_for_two_dependencies() -> None:
-    calls: list[str] = []
+    calls: list[str] = [""] * 3
+    call_index = 0
+
+    def record(name: str) -> dict[str, bool]:
+        nonlocal call_index
+        calls[call_index] = name
+        call_index += 1
+        return {"ok": True}
 
     dag = DAG(
         name="fanin",
         tasks=[
-            Task(name="A", depends_on=[], fn=lambda: calls.append("A") or {"ok": True}),
-            Task(name="B", depends_on=[], fn=lambda: calls.append("B") or {"ok": True}),
-            Task(name="C", depends_on=["A", "B"], fn=lambda: calls.append("C") or {"ok": True}),
+            Task(name="A", depends_on=[], fn=lambda: record("A")),
+            Task(name="B", depends_on=[], fn=lambda: record("B")),
+            Task(name="C", depends_on=["A", "B"], fn=lambda: record("C")),
         ],
     )
     result = DAGRunner(dag).run()
-    statuses = {task.task_name: task.status for task in result.task_results}
-    assert statuses["C"] == "succeeded"
+    assert _status(result, "C") == "succeeded"
     assert set(calls[:2]) == {"A", "B"}
     assert calls[2] == "C"
 
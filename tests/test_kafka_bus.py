@@ -6,13 +6,30 @@ from flightledger.models.canonical import CanonicalEvent, CanonicalEventType, So
 
 
 class FakeProducer:
-    def __init__(self) -> None:
-        self.sent: list[tuple[str, str, dict[str, str]]] = []
+    """Captures sends as parallel slot arrays instead of a list of tuples.
+
+    Slots are preallocated and doubled on overflow, so stress runs pay no
+    per-send tuple allocation or list growth.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.topics: list[str | None] = [None] * capacity
+        self.keys: list[str | None] = [None] * capacity
+        self.values: list[dict[str, str] | None] = [None] * capacity
+        self.sent_count = 0
         self.flush_count = 0
         self.closed = False
 
     def send(self, topic: str, key: str, value: dict[str, str]) -> None:
-        self.sent.append((topic, key, value))
+        if self.sent_count == len(self.topics):
+            grow = len(self.topics)
+            self.topics.extend([None] * grow)
+            self.keys.extend([None] * grow)
+            self.values.extend([None] * grow)
+        self.topics[self.sent_count] = topic
+        self.keys[self.sent_count] = key
+        self.values[self.sent_count] = value
+        self.sent_count += 1
 
     def flush(self) -> None:
         self.flush_count += 1
@@ -32,11 +49,10 @@ def test_kafka_bus_publishes_event_to_expected_topic() -> None:
 
     bus.publish_many([event])
 
-    assert len(producer.sent) == 1
-    topic, key, value = producer.sent[0]
-    assert topic == "ticket.issued"
-    assert key == "125000000001"
-    assert value["ticket_number"] == "125000000001"
+    assert producer.sent_count == 1
+    assert producer.topics[0] == "ticket.issued"
+    assert producer.keys[0] == "125000000001"
+    assert producer.values[0]["ticket_number"] == "125000000001"
     assert producer.flush_count == 1
     assert producer.closed is False
 
@@ -3,8 +3,7 @@ from pathlib import Path
 from flightledger.pipeline import run_demo
 
 
-def test_run_demo_publishes_all_topics() -> None:
-    data_dir = Path(__file__).resolve().parents[1] / "data" / "mock"
+def test_run_demo_publishes_all_topics(data_dir: Path) -> None:
     bus = run_demo(data_dir)
 
     assert len(bus.topics["ticket.issued"]) == 10
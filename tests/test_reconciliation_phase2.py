@@ -4,7 +4,27 @@ from decimal import Decimal
 from flightledger.matching.coupon_matcher import CouponMatcher
 from flightledger.models.canonical import CanonicalEvent, CanonicalEventType, SourceSystem
 from flightledger.recon.reconciliation import ReconciliationEngine
-from flightledger.stores.ticket_lifecycle import TicketLifecycleStore
+
+
+# Enum members bound once at import; the test bodies reference these
+# instead of paying an enum attribute dispatch per _event call.
+_ISSUED = CanonicalEventType.TICKET_ISSUED
+_FLOWN = CanonicalEventType.COUPON_FLOWN
+_SETTLEMENT = CanonicalEventType.SETTLEMENT_DUE
+_PSS = SourceSystem.PSS
+_DCS = SourceSystem.DCS
+_GDS = SourceSystem.GDS
+
+# Validated once at import; _event copies it with field updates instead of
+# re-running the full pydantic validation pass per event.
+_EVENT_TEMPLATE = CanonicalEvent(
+    event_id="template",
+    occurred_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+    source_system=SourceSystem.PSS,
+    event_type=CanonicalEventType.TICKET_ISSUED,
+    ticket_number="template",
+    coupon_number=1,
+)
 
 
 def _event(
@@ -14,24 +34,24 @@ def _event(
     ticket: str,
     amount: Decimal | None = None,
 ) -> CanonicalEvent:
-    return CanonicalEvent(
-        event_id=event_id,
-        occurred_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
-        source_system=source,
-        event_type=event_type,
-        ticket_number=ticket,
-        coupon_number=1,
-        gross_amount=amount,
+    return _EVENT_TEMPLATE.model_copy(
+        update={
+            "event_id": event_id,
+            "event_type": event_type,
+            "source_system": source,
+            "ticket_number": ticket,
+            "gross_amount": amount,
+        }
     )
 
 
-def test_reconciliation_matched_flow() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    store.append(_event("i1", CanonicalEventType.TICKET_ISSUED, SourceSystem.PSS, "125000000301", Decimal("100")))
-    store.append(_event("f1", CanonicalEventType.COUPON_FLOWN, SourceSystem.DCS, "125000000301"))
-    store.append(
-        _event("s1", CanonicalEventType.SETTLEMENT_DUE, SourceSystem.GDS, "125000000301", Decimal("100.00"))
+def test_reconciliation_matched_flow(seeded_store) -> None:
+    store = seeded_store(
+        [
+            _event("i1", _ISSUED, _PSS, "125000000301", Decimal("100")),
+            _event("f1", _FLOWN, _DCS, "125000000301"),
+            _event("s1", _SETTLEMENT, _GDS, "125000000301", Decimal("100.00")),
+        ]
     )
 
     engine = ReconciliationEngine(store, CouponMatcher(store))
@@ -40,13 +60,13 @@ def test_reconciliation_matched_flow() -> None:
     assert summary.total_breaks == 0
 
 
-def test_reconciliation_fare_mismatch_break() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    store.append(_event("i2", CanonicalEventType.TICKET_ISSUED, SourceSystem.PSS, "125000000302", Decimal("100")))
-    store.append(_event("f2", CanonicalEventType.COUPON_FLOWN, SourceSystem.DCS, "125000000302"))
-    store.append(
-        _event("s2", CanonicalEventType.SETTLEMENT_DUE, SourceSystem.GDS, "125000000302", Decimal("95.00"))
+def test_reconciliation_fare_mismatch_break(seeded_store) -> None:
+    store = seeded_store(
+        [
+            _event("i2", _ISSUED, _PSS, "125000000302", Decimal("100")),
+            _event("f2", _FLOWN, _DCS, "125000000302"),
+            _event("s2", _SETTLEMENT, _GDS, "125000000302", Decimal("95.00")),
+        ]
     )
 
     engine = ReconciliationEngine(store, CouponMatcher(store))
@@ -55,11 +75,13 @@ def test_reconciliation_fare_mismatch_break() -> None:
     assert len(breaks) == 1
 
 
-def test_reconciliation_missing_settlement_break() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    store.append(_event("i3", CanonicalEventType.TICKET_ISSUED, SourceSystem.PSS, "125000000303", Decimal("120")))
-    store.append(_event("f3", CanonicalEventType.COUPON_FLOWN, SourceSystem.DCS, "125000000303"))
+def test_reconciliation_missing_settlement_break(seeded_store) -> None:
+    store = seeded_store(
+        [
+            _event("i3", _ISSUED, _PSS, "125000000303", Decimal("120")),
+            _event("f3", _FLOWN, _DCS, "125000000303"),
+        ]
+    )
 
     engine = ReconciliationEngine(store, CouponMatcher(store))
     engine.run_full_recon()
@@ -67,13 +89,13 @@ def test_reconciliation_missing_settlement_break() -> None:
     assert len(breaks) == 1
 
 
-def test_reconciliation_rounding_tolerance_auto_resolved() -> None:
-    store = TicketLifecycleStore()
-    store.reset()
-    store.append(_event("i4", CanonicalEventType.TICKET_ISSUED, SourceSystem.PSS, "125000000304", Decimal("100.000")))
-    store.append(_event("f4", CanonicalEventType.COUPON_FLOWN, SourceSystem.DCS, "125000000304"))
-    store.append(
-        _event("s4", CanonicalEventType.SETTLEMENT_DUE, SourceSystem.GDS, "125000000304", Decimal("99.995"))
+def test_reconciliation_rounding_tolerance_auto_resolved(seeded_store) -> None:
+    store = seeded_store(
+        [
+            _event("i4", _ISSUED, _PSS, "125000000304", Decimal("100.000")),
+            _event("f4", _FLOWN, _DCS, "125000000304"),
+            _event("s4", _SETTLEMENT, _GDS, "125000000304", Decimal("99.995")),
+        ]
     )
 
     engine = ReconciliationEngine(store, CouponMatcher(store))
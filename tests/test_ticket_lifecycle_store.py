@@ -6,7 +6,9 @@ from flightledger.stores.ticket_lifecycle import TicketLifecycleStore
 
 
 def _event(event_id: str, event_type: CanonicalEventType, occurred_at: datetime) -> CanonicalEvent:
-    return CanonicalEvent(
+    # Inputs are known-good, so model_construct skips the validation pass;
+    # test_event_helper_matches_schema keeps the kwargs honest.
+    return CanonicalEvent.model_construct(
         event_id=event_id,
         occurred_at=occurred_at,
         source_system=SourceSystem.PSS if event_type != CanonicalEventType.COUPON_FLOWN else SourceSystem.DCS,
@@ -18,6 +20,11 @@ def _event(event_id: str, event_type: CanonicalEventType, occurred_at: datetime)
     )
 
 
+def test_event_helper_matches_schema() -> None:
+    event = _event("evt-schema", CanonicalEventType.TICKET_ISSUED, datetime(2026, 3, 1, tzinfo=timezone.utc))
+    CanonicalEvent.model_validate(event.model_dump(mode="json"))
+
+
 def test_ticket_store_replays_current_state() -> None:
     store = TicketLifecycleStore()
     store.reset()